@@ -1,105 +1,235 @@
-import json
+import asyncio
 import logging
 import re
-from typing import Any, List, Tuple
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+import ahocorasick
+import orjson
 
 from .config import get_settings
-from .llm import LLMClient, build_llm_client
+from .llm import LLMClient, LLMResponse, build_llm_client
 from .logging_utils import log_extra
 from .models import AgentRecommendation, IncidentTicket, Severity
 from .tracing import AgentTracer, NullTracer
 from .tools import HistoryTool, KnowledgeBaseTool
 
+try:
+    # Linear-time DFA matcher; no backtracking on long inputs. Only ever given the ASCII
+    # pattern, whose explicit whitespace set avoids RE2's narrower \s (it has no \v).
+    import re2 as _ascii_engine
+except ImportError:  # pragma: no cover - platforms without google-re2 wheels
+    _ascii_engine = re
+
+try:
+    import hyperscan  # optional SIMD multi-pattern prefilter for the PII scan
+except ImportError:  # pragma: no cover - hyperscan is not a hard dependency
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 PROMPT_VERSION = "v1.1"
 
-
-def _detect_pii(text: str) -> bool:
-    email_pattern = r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"
-    phone_pattern = r"(\+?\d{1,2}[\s\-.]?)?(\(\d{3}\)|\d{3})[\s\-.]?\d{3}[\s\-.]?\d{4}"
-    ip_pattern = r"\b(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\b"
-    ssn_pattern = r"\b\d{3}-\d{2}-\d{4}\b"
-    return bool(
-        re.search(email_pattern, text)
-        or re.search(phone_pattern, text)
-        or re.search(ip_pattern, text)
-        or re.search(ssn_pattern, text)
+# Ticket-independent prompt text, built once at import.
+_PROMPT_RULES = """- summary: short summary (<=240 chars)
+- recommended_actions: ordered list of concrete next steps
+- rationale: brief reasoning for severity and actions
+- severity is provided by upstream deterministic logic and must not be changed.
+- Do not invent or modify severity; focus only on summary/actions/rationale.
+- Keep actions concise and actionable; prefer <=5 items."""
+_PROMPT_HEADER = f"""
+You are an incident triage assistant. Produce a concise JSON response that strictly matches the schema.
+Fields:
+{_PROMPT_RULES}
+Context:"""
+_BATCH_PROMPT_HEADER = f"""
+You are an incident triage assistant. Produce a concise JSON response that strictly matches the schema.
+Return one entry in "results" per ticket, in the same order, echoing its ticket_id.
+Fields per entry:
+- ticket_id: the ticket this entry belongs to
+{_PROMPT_RULES}
+Tickets:"""
+
+
+_PII_ALTERNATIVES: Tuple[Tuple[str, str], ...] = (
+    ("email", r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"),
+    ("phone", r"(\+?\d{1,2}[\s\-.]?)?(\(\d{3}\)|\d{3})[\s\-.]?\d{3}[\s\-.]?\d{4}"),
+    ("ip", r"\b(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\b"),
+    ("ssn", r"\b\d{3}-\d{2}-\d{4}\b"),
+)
+# The ASCII characters Python's str-pattern \s matches. Bytes patterns (re and RE2) and
+# Hyperscan each use a narrower \s (no \x1c-\x1f; RE2 and Hyperscan also drop \v), so the
+# ASCII variant spells the set out. Every \s above sits inside a character class.
+_ASCII_SPACE_CHARS = r"\t\n\x0b\x0c\r\x1c-\x1f "
+_PII_ALTERNATIVES_ASCII: Tuple[Tuple[str, str], ...] = tuple(
+    (name, pattern.replace(r"\s", _ASCII_SPACE_CHARS)) for name, pattern in _PII_ALTERNATIVES
+)
+
+
+def _join_pii_alternatives(alternatives: Sequence[Tuple[str, str]]) -> str:
+    return "|".join(f"(?P<{name}>{pattern})" for name, pattern in alternatives)
+
+
+_PII_PATTERN = _join_pii_alternatives(_PII_ALTERNATIVES)
+# Compiled once at import; detection and redaction each make a single pass over the text.
+# Non-ASCII text must use stdlib re: its Unicode \d, \s and \b also match e.g. full-width
+# digits and non-ASCII spaces, which RE2 treats as ASCII-only.
+_PII_RE = re.compile(_PII_PATTERN)
+# ASCII-only text (the common case) is scanned as bytes with the explicit whitespace set,
+# which matches exactly what the str pattern matches on ASCII input.
+_PII_RE_BYTES = _ascii_engine.compile(_join_pii_alternatives(_PII_ALTERNATIVES_ASCII).encode("ascii"))
+_PII_TAGS = {
+    "email": "[REDACTED_EMAIL]",
+    "phone": "[REDACTED_PHONE]",
+    "ip": "[REDACTED_IP]",
+    "ssn": "[REDACTED_SSN]",
+}
+# Keyed by group number, which both patterns share (group names differ in type for bytes).
+_PII_TAGS_BY_GROUP = {_PII_RE.groupindex[name]: tag for name, tag in _PII_TAGS.items()}
+_PII_TAGS_BY_GROUP_BYTES = {group: tag.encode("ascii") for group, tag in _PII_TAGS_BY_GROUP.items()}
+
+
+def _build_pii_prefilter():
+    """Compile the PII alternatives into a Hyperscan block-mode database, if available."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=[pattern.encode("ascii") for _, pattern in _PII_ALTERNATIVES_ASCII],
+        ids=list(range(len(_PII_ALTERNATIVES))),
+        elements=len(_PII_ALTERNATIVES),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_PII_ALTERNATIVES),
     )
+    return db
 
 
-def _redact(text: str) -> str:
-    text = re.sub(
-        r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", "[REDACTED_EMAIL]", text
-    )
-    text = re.sub(
-        r"(\+?\d{1,2}[\s\-.]?)?(\(\d{3}\)|\d{3})[\s\-.]?\d{3}[\s\-.]?\d{4}",
-        "[REDACTED_PHONE]",
-        text,
-    )
-    text = re.sub(
-        r"\b(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\b",
-        "[REDACTED_IP]",
-        text,
-    )
-    text = re.sub(r"\b\d{3}-\d{2}-\d{4}\b", "[REDACTED_SSN]", text)
-    return text
-
-
-def _score_severity(title: str, description: str, tags: List[str]) -> Tuple[Severity, float, str]:
-    text = f"{title.lower()} {description.lower()} {' '.join(tags).lower()}"
-    lowered_tags = [t.lower() for t in tags]
-    instruction_patterns = [
-        "classify as",
-        "set severity",
-        "ignore all rules",
-        "forget all rules",
-        "override severity",
-    ]
-    stripped_for_scoring = text
-    ignored_instruction = False
-    if any(pat in text for pat in instruction_patterns):
-        stripped_for_scoring = re.sub(
-            r"(classify as|set severity|ignore all rules|forget all rules|override severity).*",
-            "",
-            text,
-        )
-        ignored_instruction = True
-    score = 0.5
-    rationale_parts = []
+_PII_PREFILTER = _build_pii_prefilter()
+# Hyperscan scratch space must not be shared between concurrent scans.
+_pii_scratch = threading.local()
 
-    critical_keywords = ["outage", "down", "unreachable", "ransomware", "breach"]
-    high_keywords = ["degraded", "latency", "data loss", "panic", "ddos"]
-    medium_keywords = ["bug", "error", "failed job", "retry", "warning", "timeout"]
-    low_keywords = ["request", "question"]
-    info_keywords = ["informational", "notice"]
 
-    target_text = stripped_for_scoring
-    if any(k in target_text for k in critical_keywords):
-        score = 0.9
-        severity = Severity.P0
-        rationale_parts.append("critical keyword detected")
-    elif any(k in target_text for k in high_keywords):
-        score = 0.8
-        severity = Severity.P1
-        rationale_parts.append("high keyword detected")
-    elif any(k in target_text for k in medium_keywords):
-        score = 0.7
-        severity = Severity.P2
-        rationale_parts.append("medium keyword detected")
-    elif any(k in target_text for k in low_keywords):
-        score = 0.55
-        severity = Severity.P3
-        rationale_parts.append("request/question keyword detected")
-    elif any(k in target_text for k in info_keywords):
-        score = 0.35
-        severity = Severity.P4
-        rationale_parts.append("informational keyword detected")
-    else:
-        score = 0.45
-        severity = Severity.P4
-        rationale_parts.append("no strong signals")
+def _halt_on_match(*_args) -> bool:
+    return True  # one match is enough; stops the scan with ScanTerminated
+
+
+def _may_contain_pii(data: bytes) -> bool:
+    """
+    Hyperscan prefilter for ASCII text: False means no alternative can match, so the
+    regex pass is skipped. Without hyperscan every text goes to the regex engine.
+    """
+    if _PII_PREFILTER is None:
+        return True
+    scratch = getattr(_pii_scratch, "scratch", None)
+    if scratch is None:
+        scratch = _pii_scratch.scratch = hyperscan.Scratch(_PII_PREFILTER)
+    try:
+        _PII_PREFILTER.scan(data, match_event_handler=_halt_on_match, scratch=scratch)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+def _detect_pii(text: str) -> bool:
+    if text.isascii():
+        data = text.encode("ascii")
+        return _may_contain_pii(data) and _PII_RE_BYTES.search(data) is not None
+    return _PII_RE.search(text) is not None
+
+
+def _scan_and_redact(text: str, do_redact: bool) -> Tuple[bool, str]:
+    """Detect PII and, when requested, redact it in the same pass. Returns (has_pii, text)."""
+    if not do_redact:
+        return _detect_pii(text), text
+    if text.isascii():
+        data = text.encode("ascii")
+        if not _may_contain_pii(data):
+            return False, text
+        redacted, count = _PII_RE_BYTES.subn(lambda m: _PII_TAGS_BY_GROUP_BYTES[m.lastindex], data)
+        return (True, redacted.decode("ascii")) if count else (False, text)
+    redacted, count = _PII_RE.subn(lambda m: _PII_TAGS_BY_GROUP[m.lastindex], text)
+    return count > 0, redacted
+
+
+_CRITICAL = "critical keyword detected"
+_HIGH = "high keyword detected"
+_MEDIUM = "medium keyword detected"
+_LOW = "request/question keyword detected"
+_INFO = "informational keyword detected"
+
+# (keyword, score, severity, rationale) in priority order: the earliest rule that
+# matches decides the severity.
+_SEVERITY_RULES: Tuple[Tuple[str, float, Severity, str], ...] = (
+    ("outage", 0.9, Severity.P0, _CRITICAL),
+    ("down", 0.9, Severity.P0, _CRITICAL),
+    ("unreachable", 0.9, Severity.P0, _CRITICAL),
+    ("ransomware", 0.9, Severity.P0, _CRITICAL),
+    ("breach", 0.9, Severity.P0, _CRITICAL),
+    ("degraded", 0.8, Severity.P1, _HIGH),
+    ("latency", 0.8, Severity.P1, _HIGH),
+    ("data loss", 0.8, Severity.P1, _HIGH),
+    ("panic", 0.8, Severity.P1, _HIGH),
+    ("ddos", 0.8, Severity.P1, _HIGH),
+    ("bug", 0.7, Severity.P2, _MEDIUM),
+    ("error", 0.7, Severity.P2, _MEDIUM),
+    ("failed job", 0.7, Severity.P2, _MEDIUM),
+    ("retry", 0.7, Severity.P2, _MEDIUM),
+    ("warning", 0.7, Severity.P2, _MEDIUM),
+    ("timeout", 0.7, Severity.P2, _MEDIUM),
+    ("request", 0.55, Severity.P3, _LOW),
+    ("question", 0.55, Severity.P3, _LOW),
+    ("informational", 0.35, Severity.P4, _INFO),
+    ("notice", 0.35, Severity.P4, _INFO),
+)
+_NO_SIGNAL_RULE = ("", 0.45, Severity.P4, "no strong signals")
+
+
+def _build_severity_automaton() -> "ahocorasick.Automaton":
+    # Payload is (rule position, keyword length); the smallest position is the highest priority.
+    automaton = ahocorasick.Automaton()
+    for index, (keyword, _, _, _) in enumerate(_SEVERITY_RULES):
+        automaton.add_word(keyword, (index, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+_SEVERITY_AUTOMATON = _build_severity_automaton()
+_INSTRUCTION_RE = re.compile(
+    r"(classify as|set severity|ignore all rules|forget all rules|override severity).*"
+)
+
+
+def _score_severity(title: str, description: str, tags_lower: Sequence[str]) -> Tuple[Severity, float, str]:
+    text = " ".join((title, description, *tags_lower)).casefold()
+    # One C-level pass both finds and strips instruction-like overrides (to end of line).
+    stripped_for_scoring, instruction_hits = _INSTRUCTION_RE.subn("", text)
+    ignored_instruction = instruction_hits > 0
+    rationale_parts = []
 
-    if "p0" in lowered_tags:
+    # Single pass over the text; keep the highest-priority rule seen. Keywords must
+    # stand as whole words (a plural "s" is allowed) so "downtime" does not count as "down".
+    text_len = len(stripped_for_scoring)
+    best = len(_SEVERITY_RULES)
+    for end, (index, length) in _SEVERITY_AUTOMATON.iter(stripped_for_scoring):
+        if index >= best:
+            continue
+        start = end - length + 1
+        if start > 0 and _is_word_char(stripped_for_scoring[start - 1]):
+            continue
+        after = end + 1
+        if after < text_len and stripped_for_scoring[after] == "s":
+            after += 1
+        if after < text_len and _is_word_char(stripped_for_scoring[after]):
+            continue
+        best = index
+    _, score, severity, reason = _SEVERITY_RULES[best] if best < len(_SEVERITY_RULES) else _NO_SIGNAL_RULE
+    rationale_parts.append(reason)
+
+    if "p0" in tags_lower:
         severity = Severity.P0
         score = max(score, 0.92)
         rationale_parts.append("explicit severity tag")
@@ -110,11 +240,12 @@ def _score_severity(title: str, description: str, tags: List[str]) -> Tuple[Seve
 
 
 def _summarize_text(text: str) -> str:
-    description = text.strip().replace("\\n", " ")
-    summary = description[:240]
-    if len(description) > 240:
-        summary += "..."
-    return summary
+    description = text.strip()
+    if "\\n" in description:
+        description = description.replace("\\n", " ")
+    if len(description) <= 240:
+        return description
+    return description[:240] + "..."
 
 
 def _recommend_actions(severity: Severity, has_pii: bool) -> List[str]:
@@ -132,6 +263,9 @@ def _recommend_actions(severity: Severity, has_pii: bool) -> List[str]:
     return actions
 
 
+_JSON_BLOCK_RE = re.compile(r"<<JSON>>(.*?)<</JSON>>", re.S)
+
+
 def _parse_llm_payload(content: str) -> dict:
     """
     Tolerant JSON extractor: try direct JSON, then look for a JSON block between markers,
@@ -140,18 +274,19 @@ def _parse_llm_payload(content: str) -> dict:
     if not content:
         return {}
     content = content.strip()
-    try:
-        return json.loads(content)
-    except Exception:
-        pass
+    # Only attempt a direct parse when the reply can be JSON; raising and catching a
+    # decode error on prose replies is the expensive path.
+    if content.startswith(("{", "[")):
+        try:
+            return orjson.loads(content)
+        except Exception:
+            pass
 
     # Look for explicit markers
-    start_marker = "<<JSON>>"
-    end_marker = "<</JSON>>"
-    if start_marker in content and end_marker in content:
-        block = content.split(start_marker, 1)[1].split(end_marker, 1)[0].strip()
+    match = _JSON_BLOCK_RE.search(content)
+    if match:
         try:
-            return json.loads(block)
+            return orjson.loads(match.group(1))
         except Exception:
             pass
 
@@ -161,7 +296,7 @@ def _parse_llm_payload(content: str) -> dict:
     if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
         candidate = content[first_brace : last_brace + 1]
         try:
-            return json.loads(candidate)
+            return orjson.loads(candidate)
         except Exception:
             pass
 
@@ -219,6 +354,78 @@ def _build_plan(
     return plan
 
 
+# Only short tickets are memoized. The cache key holds the raw, possibly PII-bearing text and
+# the value its redacted copy, so entries stay in process memory until evicted; capping the
+# size keeps that to roughly 4096 * 2 * 4 KiB (~32 MiB) at most. Duplicate alerts and
+# retries are short, so large /triage/file payloads lose nothing by bypassing the cache.
+_TRIAGE_CACHE_MAX_CHARS = 4096
+
+
+def _triage_text(
+    title: str, description: str, tags_lower: Tuple[str, ...], redact_pii: bool
+) -> Tuple[bool, bool, str, Severity, float, str]:
+    has_pii, description = _scan_and_redact(description, redact_pii)
+    redacted = has_pii and redact_pii
+    severity, confidence, rationale = _score_severity(title, description, tags_lower)
+    return has_pii, redacted, description, severity, confidence, rationale
+
+
+_triage_text_cached = lru_cache(maxsize=4096)(_triage_text)
+
+
+def _deterministic_triage(
+    title: str, description: str, tags_lower: Tuple[str, ...], redact_pii: bool
+) -> Tuple[bool, bool, str, Severity, float, str]:
+    """
+    PII handling and severity scoring for one ticket, memoized for short tickets so duplicate
+    alerts and retries skip the regex work. redact_pii is part of the key so a settings change
+    cannot serve stale redactions.
+    Returns (has_pii, redacted, description, severity, confidence, rationale).
+    """
+    if len(title) + len(description) <= _TRIAGE_CACHE_MAX_CHARS:
+        return _triage_text_cached(title, description, tags_lower, redact_pii)
+    return _triage_text(title, description, tags_lower, redact_pii)
+
+
+def _index_batch_results(payload: dict, ticket_ids: List[str]) -> Dict[str, dict]:
+    """
+    Map entries of a batch LLM payload ({"results": [...]}) to ticket ids.
+    Entries without a usable ticket_id are matched by position.
+    """
+    results = payload.get("results") if isinstance(payload, dict) else None
+    if not isinstance(results, list):
+        return {}
+    known_ids = set(ticket_ids)
+    indexed: Dict[str, dict] = {}
+    for position, entry in enumerate(results):
+        if not isinstance(entry, dict):
+            continue
+        ticket_id = entry.get("ticket_id")
+        if ticket_id not in known_ids:
+            if position >= len(ticket_ids):
+                continue
+            ticket_id = ticket_ids[position]
+        indexed.setdefault(ticket_id, entry)
+    return indexed
+
+
+@dataclass
+class _TriageContext:
+    """Deterministic triage state for one ticket, shared by single and batch processing."""
+
+    ticket: IncidentTicket
+    severity: Severity
+    confidence: float
+    rationale: str
+    redacted: bool
+    knowledge_refs: List[str]
+    history_refs: List[str]
+    escalation_required: bool
+    fallback_summary: str
+    fallback_actions: List[str]
+    plan_steps: List[str]
+
+
 class IncidentTriageAgent:
     def __init__(
         self,
@@ -230,8 +437,17 @@ class IncidentTriageAgent:
         self.kb_tool = kb_tool
         self.history_tool = history_tool
         self.settings = get_settings()
+        # Plain attributes for fields read on every ticket.
+        self._redact_pii = self.settings.redact_pii
+        self._conf_threshold = self.settings.confidence_threshold
+        self._max_tokens = self.settings.max_tokens
+        self._service_name = self.settings.service_name
+        self._batch_size = max(1, self.settings.batch_size)
+        self._batch_max_tokens = self.settings.batch_max_tokens
         self.llm = llm_client or build_llm_client()
         self.tracer = tracer or NullTracer()
+        # Call sites check this before building trace payloads, so a no-op tracer costs nothing.
+        self._trace_enabled = not getattr(self.tracer, "is_noop", False)
 
     def _record_trace(self, phase: str, **data: Any) -> None:
         try:
@@ -249,16 +465,7 @@ class IncidentTriageAgent:
         fallback_actions: List[str],
         fallback_rationale: str,
     ) -> str:
-        return f"""
-You are an incident triage assistant. Produce a concise JSON response that strictly matches the schema.
-Fields:
-- summary: short summary (<=240 chars)
-- recommended_actions: ordered list of concrete next steps
-- rationale: brief reasoning for severity and actions
-- severity is provided by upstream deterministic logic and must not be changed.
-- Do not invent or modify severity; focus only on summary/actions/rationale.
-- Keep actions concise and actionable; prefer <=5 items.
-Context:
+        return f"""{_PROMPT_HEADER}
 - ticket_id: {ticket.id}
 - severity: {severity.value}
 - tags: {', '.join(ticket.tags)}
@@ -270,42 +477,77 @@ Return JSON only. Use this template between markers:
 <<JSON>>
 {{
   "summary": "{fallback_summary}",
-  "recommended_actions": {json.dumps(fallback_actions)},
+  "recommended_actions": {orjson.dumps(fallback_actions).decode()},
   "rationale": "{fallback_rationale}"
 }}
 <</JSON>>
 """
 
-    def process(self, ticket: IncidentTicket) -> AgentRecommendation:
-        self._record_trace("ticket_received", ticket=ticket.model_dump())
-        logger.info(
-            "processing_ticket",
-            extra=log_extra(
-                ticket_id=ticket.id,
-                source=ticket.source,
-                service=self.settings.service_name,
-            ),
-        )
+    def _build_batch_prompt(self, contexts: List[_TriageContext]) -> str:
+        ticket_lines = []
+        template_results = []
+        for ctx in contexts:
+            ticket_lines.append(
+                f"- ticket_id: {ctx.ticket.id}; severity: {ctx.severity.value}; "
+                f"tags: {', '.join(ctx.ticket.tags)}; "
+                f"knowledge_refs: {', '.join(ctx.knowledge_refs) or 'none'}; "
+                f"history_refs: {', '.join(ctx.history_refs) or 'none'}"
+            )
+            template_results.append(
+                {
+                    "ticket_id": ctx.ticket.id,
+                    "summary": ctx.fallback_summary,
+                    "recommended_actions": ctx.fallback_actions,
+                    "rationale": ctx.rationale,
+                }
+            )
+        tickets_block = "\n".join(ticket_lines)
+        template = orjson.dumps({"results": template_results}, option=orjson.OPT_INDENT_2).decode()
+        return f"""{_BATCH_PROMPT_HEADER}
+{tickets_block}
+- prompt_version: {PROMPT_VERSION}
 
-        has_pii = _detect_pii(ticket.description)
-        redacted = False
-        description = ticket.description
-        if has_pii and self.settings.redact_pii:
-            description = _redact(description)
-            redacted = True
-        self._record_trace("pii_scan", has_pii=has_pii, redacted=redacted)
+Return JSON only. Use this template between markers:
+<<JSON>>
+{template}
+<</JSON>>
+"""
+
+    def _prepare(self, ticket: IncidentTicket) -> _TriageContext:
+        """Run the deterministic part of triage: PII handling, scoring and tool lookups."""
+        if self._trace_enabled:
+            self._record_trace("ticket_received", ticket=ticket.model_dump())
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "processing_ticket",
+                extra=log_extra(
+                    ticket_id=ticket.id,
+                    source=ticket.source,
+                    service=self._service_name,
+                ),
+            )
+
+        has_pii, redacted, description, severity, confidence, rationale = _deterministic_triage(
+            ticket.title,
+            ticket.description,
+            # Folded per call: tickets are mutable, so a value cached on the model can go stale.
+            tuple(tag.casefold() for tag in ticket.tags),
+            self._redact_pii,
+        )
+        if self._trace_enabled:
+            self._record_trace("pii_scan", has_pii=has_pii, redacted=redacted)
 
-        severity, confidence, rationale = _score_severity(ticket.title, description, ticket.tags)
         knowledge_refs = self.kb_tool.search(description)
         history_refs = self.history_tool.search(description)
-        self._record_trace(
-            "severity_scored",
-            severity=severity.value,
-            confidence=confidence,
-            rationale=rationale,
-            knowledge_refs=knowledge_refs,
-            history_refs=history_refs,
-        )
+        if self._trace_enabled:
+            self._record_trace(
+                "severity_scored",
+                severity=severity.value,
+                confidence=confidence,
+                rationale=rationale,
+                knowledge_refs=knowledge_refs,
+                history_refs=history_refs,
+            )
 
         if knowledge_refs:
             confidence += 0.05
@@ -315,53 +557,125 @@ Return JSON only. Use this template between markers:
             rationale += "; similar historical incident"
 
         confidence = min(confidence, 0.98)
-        escalation_required = confidence < self.settings.confidence_threshold
+        escalation_required = confidence < self._conf_threshold
         summary_source = description if redacted else ticket.description
         fallback_summary = _summarize_text(summary_source)
         fallback_actions = _recommend_actions(severity, has_pii)
         plan_steps = _build_plan(severity, knowledge_refs, history_refs, fallback_actions)
-        self._record_trace(
-            "contextual_hits",
-            knowledge_refs=knowledge_refs,
-            history_refs=history_refs,
-            adjusted_confidence=confidence,
-            escalation_required=escalation_required,
-            plan=plan_steps,
-        )
+        if self._trace_enabled:
+            self._record_trace(
+                "contextual_hits",
+                knowledge_refs=knowledge_refs,
+                history_refs=history_refs,
+                adjusted_confidence=confidence,
+                escalation_required=escalation_required,
+                plan=plan_steps,
+            )
 
-        prompt = self._build_prompt(
+        return _TriageContext(
             ticket=ticket,
             severity=severity,
+            confidence=confidence,
+            rationale=rationale,
+            redacted=redacted,
             knowledge_refs=knowledge_refs,
             history_refs=history_refs,
+            escalation_required=escalation_required,
             fallback_summary=fallback_summary,
             fallback_actions=fallback_actions,
-            fallback_rationale=rationale,
+            plan_steps=plan_steps,
         )
-        self._record_trace(
-            "prompt_built",
-            prompt_version=PROMPT_VERSION,
-            fallback_summary=fallback_summary,
-            fallback_actions=fallback_actions,
-            plan=plan_steps,
+
+    def _finalize(self, ctx: _TriageContext, llm_payload: dict) -> AgentRecommendation:
+        """Merge (validated) LLM output with the deterministic context into a recommendation."""
+        ticket = ctx.ticket
+        summary = llm_payload.get("summary", ctx.fallback_summary)
+        actions = llm_payload.get("recommended_actions", ctx.fallback_actions)
+        rationale_text = llm_payload.get("rationale", ctx.rationale)
+
+        summary, actions, rationale_text = _validate_llm_payload(
+            summary=summary,
+            actions=actions,
+            rationale=rationale_text,
+            fallback_summary=ctx.fallback_summary,
+            fallback_actions=ctx.fallback_actions,
+            fallback_rationale=ctx.rationale,
         )
+        if ctx.escalation_required:
+            # Help reviewers by surfacing the plan for low-confidence cases.
+            rationale_text = f"{rationale_text}; plan: {' | '.join(ctx.plan_steps)}"
 
-        llm_resp = None
-        llm_payload = {}
-        try:
-            llm_resp = self.llm.generate(prompt, max_tokens=self.settings.max_tokens)
-            llm_payload = _parse_llm_payload(llm_resp.content)
-            if not llm_payload:
-                raise ValueError("empty_or_invalid_llm_payload")
+        recommendation = AgentRecommendation(
+            summary=summary,
+            severity=ctx.severity,
+            recommended_actions=actions,
+            confidence=round(ctx.confidence, 3),
+            escalation_required=ctx.escalation_required,
+            rationale=rationale_text,
+            redacted=ctx.redacted,
+            knowledge_refs=ctx.knowledge_refs,
+            history_refs=ctx.history_refs,
+        )
+
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "llm_completed",
+                "triage_decision",
                 extra=log_extra(
                     ticket_id=ticket.id,
+                    severity=recommendation.severity.value,
+                    confidence=recommendation.confidence,
+                    escalation=recommendation.escalation_required,
+                    redacted=recommendation.redacted,
+                ),
+            )
+        if self._trace_enabled:
+            self._record_trace(
+                "recommendation_finalized",
+                summary=summary,
+                severity=recommendation.severity.value,
+                confidence=recommendation.confidence,
+                escalation_required=ctx.escalation_required,
+                redacted=ctx.redacted,
+                ticket_id=ticket.id,
+            )
+
+        return recommendation
+
+    def _prompt_for(self, ctx: _TriageContext) -> str:
+        prompt = self._build_prompt(
+            ticket=ctx.ticket,
+            severity=ctx.severity,
+            knowledge_refs=ctx.knowledge_refs,
+            history_refs=ctx.history_refs,
+            fallback_summary=ctx.fallback_summary,
+            fallback_actions=ctx.fallback_actions,
+            fallback_rationale=ctx.rationale,
+        )
+        if self._trace_enabled:
+            self._record_trace(
+                "prompt_built",
+                prompt_version=PROMPT_VERSION,
+                fallback_summary=ctx.fallback_summary,
+                fallback_actions=ctx.fallback_actions,
+                plan=ctx.plan_steps,
+            )
+        return prompt
+
+    def _read_llm_response(self, ticket_id: str, llm_resp: LLMResponse) -> dict:
+        llm_payload = _parse_llm_payload(llm_resp.content)
+        if not llm_payload:
+            raise ValueError("empty_or_invalid_llm_payload")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "llm_completed",
+                extra=log_extra(
+                    ticket_id=ticket_id,
                     cost_usd=round(llm_resp.cost_usd, 6),
                     prompt_tokens=llm_resp.prompt_tokens,
                     completion_tokens=llm_resp.completion_tokens,
                 ),
             )
+        if self._trace_enabled:
             self._record_trace(
                 "llm_response",
                 prompt_version=PROMPT_VERSION,
@@ -370,13 +684,19 @@ Return JSON only. Use this template between markers:
                 completion_tokens=llm_resp.completion_tokens,
                 cost_usd=round(llm_resp.cost_usd, 6),
             )
-        except Exception as exc:
+        return llm_payload
+
+    def _record_llm_failure(
+        self, ticket_id: str, exc: Exception, llm_resp: LLMResponse | None
+    ) -> None:
+        if logger.isEnabledFor(logging.WARNING):
             logger.warning(
                 "llm_failure_fallback error=%s content_snippet=%s",
                 exc,
                 (llm_resp.content[:240] if llm_resp else ""),
-                extra=log_extra(ticket_id=ticket.id),
+                extra=log_extra(ticket_id=ticket_id),
             )
+        if self._trace_enabled:
             self._record_trace(
                 "llm_failure",
                 error=str(exc),
@@ -384,52 +704,121 @@ Return JSON only. Use this template between markers:
                 content_snippet=(llm_resp.content[:240] if llm_resp else ""),
             )
 
-        summary = llm_payload.get("summary", fallback_summary)
-        actions = llm_payload.get("recommended_actions", fallback_actions)
-        rationale_text = llm_payload.get("rationale", rationale)
+    def _prepare_with_prompt(self, ticket: IncidentTicket) -> Tuple[_TriageContext, str]:
+        ctx = self._prepare(ticket)
+        return ctx, self._prompt_for(ctx)
 
-        summary, actions, rationale_text = _validate_llm_payload(
-            summary=summary,
-            actions=actions,
-            rationale=rationale_text,
-            fallback_summary=fallback_summary,
-            fallback_actions=fallback_actions,
-            fallback_rationale=rationale,
-        )
-        if escalation_required:
-            # Help reviewers by surfacing the plan for low-confidence cases.
-            rationale_text = f"{rationale_text}; plan: {' | '.join(plan_steps)}"
+    def process(self, ticket: IncidentTicket) -> AgentRecommendation:
+        ctx = self._prepare(ticket)
+        prompt = self._prompt_for(ctx)
 
-        recommendation = AgentRecommendation(
-            summary=summary,
-            severity=severity,
-            recommended_actions=actions,
-            confidence=round(confidence, 3),
-            escalation_required=escalation_required,
-            rationale=rationale_text,
-            redacted=redacted,
-            knowledge_refs=knowledge_refs,
-            history_refs=history_refs,
-        )
+        llm_resp = None
+        llm_payload = {}
+        try:
+            llm_resp = self.llm.generate(prompt, max_tokens=self._max_tokens)
+            llm_payload = self._read_llm_response(ticket.id, llm_resp)
+        except Exception as exc:
+            self._record_llm_failure(ticket.id, exc, llm_resp)
 
-        logger.info(
-            "triage_decision",
-            extra=log_extra(
-                ticket_id=ticket.id,
-                severity=recommendation.severity.value,
-                confidence=recommendation.confidence,
-                escalation=recommendation.escalation_required,
-                redacted=recommendation.redacted,
-            ),
-        )
-        self._record_trace(
-            "recommendation_finalized",
-            summary=summary,
-            severity=recommendation.severity.value,
-            confidence=recommendation.confidence,
-            escalation_required=escalation_required,
-            redacted=redacted,
-            ticket_id=ticket.id,
-        )
+        return self._finalize(ctx, llm_payload)
 
-        return recommendation
+    async def aprocess(self, ticket: IncidentTicket) -> AgentRecommendation:
+        """
+        Async variant of process() for use inside an event loop.
+        The deterministic stage and prompt build scale with the description (PII scan, keyword
+        search, tracer I/O), so they run in one worker-thread hop instead of on the loop.
+        """
+        ctx, prompt = await asyncio.to_thread(self._prepare_with_prompt, ticket)
+
+        llm_resp = None
+        llm_payload = {}
+        try:
+            llm_resp = await self.llm.agenerate(prompt, max_tokens=self._max_tokens)
+            llm_payload = self._read_llm_response(ticket.id, llm_resp)
+        except Exception as exc:
+            self._record_llm_failure(ticket.id, exc, llm_resp)
+
+        return self._finalize(ctx, llm_payload)
+
+    def sub_batches(self, tickets: Sequence[IncidentTicket]) -> List[Sequence[IncidentTicket]]:
+        """Split tickets into slices of at most `batch_size`, one LLM request each."""
+        size = self._batch_size
+        return [tickets[start : start + size] for start in range(0, len(tickets), size)]
+
+    def process_batch(self, tickets: List[IncidentTicket]) -> List[AgentRecommendation]:
+        """
+        Triage several tickets with one LLM request per sub-batch of `batch_size` tickets,
+        run sequentially. Callers wanting concurrency can dispatch process_sub_batch() over
+        sub_batches() themselves.
+        """
+        recommendations: List[AgentRecommendation] = []
+        for sub_batch in self.sub_batches(tickets):
+            recommendations.extend(self.process_sub_batch(sub_batch))
+        return recommendations
+
+    def process_sub_batch(self, tickets: Sequence[IncidentTicket]) -> List[AgentRecommendation]:
+        """
+        Triage up to `batch_size` tickets with a single LLM request.
+        Deterministic scoring stays per ticket; the shared prompt instructions are sent once,
+        and the request's output budget stays within `batch_max_tokens`.
+        """
+        contexts = [self._prepare(ticket) for ticket in tickets]
+        if not contexts:
+            return []
+        ticket_ids = [ctx.ticket.id for ctx in contexts]
+
+        prompt = self._build_batch_prompt(contexts)
+        if self._trace_enabled:
+            self._record_trace(
+                "prompt_built",
+                prompt_version=PROMPT_VERSION,
+                ticket_ids=ticket_ids,
+            )
+
+        llm_resp = None
+        results: Dict[str, dict] = {}
+        try:
+            llm_resp = self.llm.generate(
+                prompt, max_tokens=min(self._max_tokens * len(contexts), self._batch_max_tokens)
+            )
+            results = _index_batch_results(_parse_llm_payload(llm_resp.content), ticket_ids)
+            if not results:
+                raise ValueError("empty_or_invalid_llm_payload")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "llm_completed",
+                    extra=log_extra(
+                        ticket_ids=ticket_ids,
+                        cost_usd=round(llm_resp.cost_usd, 6),
+                        prompt_tokens=llm_resp.prompt_tokens,
+                        completion_tokens=llm_resp.completion_tokens,
+                    ),
+                )
+            if self._trace_enabled:
+                self._record_trace(
+                    "llm_response",
+                    prompt_version=PROMPT_VERSION,
+                    provider=self.llm.__class__.__name__,
+                    prompt_tokens=llm_resp.prompt_tokens,
+                    completion_tokens=llm_resp.completion_tokens,
+                    cost_usd=round(llm_resp.cost_usd, 6),
+                    ticket_ids=ticket_ids,
+                )
+        except Exception as exc:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "llm_failure_fallback error=%s content_snippet=%s",
+                    exc,
+                    (llm_resp.content[:240] if llm_resp else ""),
+                    extra=log_extra(ticket_ids=ticket_ids),
+                )
+            if self._trace_enabled:
+                self._record_trace(
+                    "llm_failure",
+                    error=str(exc),
+                    prompt_version=PROMPT_VERSION,
+                    content_snippet=(llm_resp.content[:240] if llm_resp else ""),
+                    ticket_ids=ticket_ids,
+                )
+
+        return [self._finalize(ctx, results.get(ctx.ticket.id, {})) for ctx in contexts]
@@ -1,7 +1,7 @@
+from dataclasses import dataclass
 from functools import lru_cache
 import os
 from typing import Optional
-from pydantic import BaseModel
 
 
 _DEFAULT_LLM_MODELS = {
@@ -11,27 +11,55 @@ _DEFAULT_LLM_MODELS = {
 }
 
 
-class Settings(BaseModel):
-    llm_provider: str = os.getenv("LLM_PROVIDER") or "mock"
-    llm_model: str = os.getenv("LLM_MODEL", "")
-    llm_fail_open: bool = os.getenv("LLM_FAIL_OPEN", "false").lower() == "true"
-    openai_api_key: Optional[str] = os.getenv("OPENAI_API_KEY")
-    openai_base_url: Optional[str] = os.getenv("OPENAI_BASE_URL")
-    ollama_model: Optional[str] = os.getenv("OLLAMA_MODEL")
-    ollama_base_url: str = os.getenv("OLLAMA_BASE_URL", "http://127.0.0.1:11434")
-    max_tokens: int = int(os.getenv("MAX_TOKENS", "512"))
-    cost_per_1k_tokens: float = float(os.getenv("COST_PER_1K_TOKENS", "0.0"))
-    confidence_threshold: float = float(os.getenv("CONFIDENCE_THRESHOLD", "0.65"))
-    redact_pii: bool = os.getenv("REDACT_PII", "true").lower() == "true"
-    knowledge_base_path: str = os.getenv(
-        "KNOWLEDGE_BASE_PATH", "data/knowledge_base.json"
-    )
-    history_path: str = os.getenv("HISTORY_PATH", "data/history.json")
-    evaluation_cases_path: str = os.getenv(
-        "EVAL_CASES_PATH", "data/eval_cases.json"
-    )
-    traces_path: str = os.getenv("TRACES_PATH", "data/traces.jsonl")
-    service_name: str = os.getenv("SERVICE_NAME", "incident-triage-agent")
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    llm_provider: str = "mock"
+    llm_model: str = ""
+    llm_fail_open: bool = False
+    openai_api_key: Optional[str] = None
+    openai_base_url: Optional[str] = None
+    ollama_model: Optional[str] = None
+    ollama_base_url: str = "http://127.0.0.1:11434"
+    max_tokens: int = 512
+    cost_per_1k_tokens: float = 0.0
+    confidence_threshold: float = 0.65
+    redact_pii: bool = True
+    knowledge_base_path: str = "data/knowledge_base.json"
+    history_path: str = "data/history.json"
+    evaluation_cases_path: str = "data/eval_cases.json"
+    traces_path: str = "data/traces.jsonl"
+    service_name: str = "incident-triage-agent"
+    batch_max_workers: int = 8
+    batch_size: int = 8
+    batch_max_tokens: int = 4096
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            llm_provider=os.getenv("LLM_PROVIDER") or "mock",
+            llm_model=os.getenv("LLM_MODEL", ""),
+            llm_fail_open=_env_flag("LLM_FAIL_OPEN", "false"),
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            openai_base_url=os.getenv("OPENAI_BASE_URL"),
+            ollama_model=os.getenv("OLLAMA_MODEL"),
+            ollama_base_url=os.getenv("OLLAMA_BASE_URL", "http://127.0.0.1:11434"),
+            max_tokens=int(os.getenv("MAX_TOKENS", "512")),
+            cost_per_1k_tokens=float(os.getenv("COST_PER_1K_TOKENS", "0.0")),
+            confidence_threshold=float(os.getenv("CONFIDENCE_THRESHOLD", "0.65")),
+            redact_pii=_env_flag("REDACT_PII", "true"),
+            knowledge_base_path=os.getenv("KNOWLEDGE_BASE_PATH", "data/knowledge_base.json"),
+            history_path=os.getenv("HISTORY_PATH", "data/history.json"),
+            evaluation_cases_path=os.getenv("EVAL_CASES_PATH", "data/eval_cases.json"),
+            traces_path=os.getenv("TRACES_PATH", "data/traces.jsonl"),
+            service_name=os.getenv("SERVICE_NAME", "incident-triage-agent"),
+            batch_max_workers=int(os.getenv("BATCH_MAX_WORKERS", "8")),
+            batch_size=int(os.getenv("BATCH_SIZE", "8")),
+            batch_max_tokens=int(os.getenv("BATCH_MAX_TOKENS", "4096")),
+        )
 
     def resolved_llm_model(self) -> str:
         provider = (self.llm_provider or "mock").strip().lower()
@@ -44,4 +72,4 @@ class Settings(BaseModel):
 
 @lru_cache
 def get_settings() -> Settings:
-    return Settings()
+    return Settings.from_env()
@@ -0,0 +1,17 @@
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+# Files at least this large are parsed from a read-only mapping instead of a bytes copy.
+_MMAP_THRESHOLD_BYTES = 1 << 20
+
+
+def read_json(path: str | Path) -> Any:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -11,6 +12,9 @@ from .logging_utils import log_extra
 
 logger = logging.getLogger(__name__)
 
+# Sized for BATCH_MAX_WORKERS-style concurrency with headroom for concurrent /triage calls.
+_HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
 
 @dataclass
 class LLMResponse:
@@ -25,6 +29,17 @@ class LLMClient(ABC):
     def generate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:
         raise NotImplementedError
 
+    async def agenerate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:
+        """
+        Async generation. Defaults to running generate() in a worker thread;
+        providers with native async clients override this.
+        """
+        return await asyncio.to_thread(self.generate, prompt, max_tokens)
+
+    async def aclose(self) -> None:
+        """Release pooled connections; called on application shutdown."""
+        return None
+
 
 class MockLLMClient(LLMClient):
     """
@@ -47,14 +62,15 @@ class MockLLMClient(LLMClient):
         # Mock output assumes prompt contains a JSON skeleton between markers
         content = self._synthesize_response(prompt)
 
-        logger.info(
-            "llm_generate",
-            extra=log_extra(
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                cost_usd=round(cost_usd, 6),
-            ),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "llm_generate",
+                extra=log_extra(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cost_usd=round(cost_usd, 6),
+                ),
+            )
         return LLMResponse(
             content=content,
             prompt_tokens=prompt_tokens,
@@ -62,6 +78,10 @@ class MockLLMClient(LLMClient):
             cost_usd=cost_usd,
         )
 
+    async def agenerate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:
+        # No I/O involved; avoid the thread hop of the default implementation.
+        return self.generate(prompt, max_tokens=max_tokens)
+
     def _synthesize_response(self, prompt: str) -> str:
         # Extract JSON template enclosed by <<JSON>> markers if present
         start = prompt.find("<<JSON>>")
@@ -91,7 +111,7 @@ class OpenAILLMClient(LLMClient):
 
     def __init__(self):
         try:
-            from openai import OpenAI  # type: ignore
+            from openai import AsyncOpenAI, OpenAI  # type: ignore
         except ImportError as exc:  # pragma: no cover - import guard
             raise RuntimeError(
                 "openai package not installed; add openai to requirements"
@@ -105,35 +125,56 @@ class OpenAILLMClient(LLMClient):
             api_key=settings.openai_api_key,
             base_url=settings.openai_base_url,
         )
+        self.async_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url,
+        )
         self.model = settings.resolved_llm_model()
         self.cost_per_1k_tokens = float(
             getattr(settings, "cost_per_1k_tokens", "0.0")
         )
 
+    async def aclose(self) -> None:
+        self.client.close()
+        await self.async_client.close()
+
+    def _request(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": 0.2,
+            "response_format": {"type": "json_object"},
+        }
+
     def generate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:
-        resp = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=max_tokens,
-            temperature=0.2,
-            response_format={"type": "json_object"},
+        resp = self.client.chat.completions.create(**self._request(prompt, max_tokens))
+        return self._to_response(resp)
+
+    async def agenerate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:
+        resp = await self.async_client.chat.completions.create(
+            **self._request(prompt, max_tokens)
         )
+        return self._to_response(resp)
+
+    def _to_response(self, resp: Any) -> LLMResponse:
         content = resp.choices[0].message.content or "{}"
         usage = resp.usage
         prompt_tokens = usage.prompt_tokens if usage else 0
         completion_tokens = usage.completion_tokens if usage else 0
         cost_usd = ((prompt_tokens + completion_tokens) / 1000) * self.cost_per_1k_tokens
 
-        logger.info(
-            "llm_generate",
-            extra=log_extra(
-                provider="openai",
-                model=self.model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                cost_usd=round(cost_usd, 6),
-            ),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "llm_generate",
+                extra=log_extra(
+                    provider="openai",
+                    model=self.model,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cost_usd=round(cost_usd, 6),
+                ),
+            )
         return LLMResponse(
             content=content,
             prompt_tokens=prompt_tokens,
@@ -152,39 +193,59 @@ class OllamaLLMClient(LLMClient):
         settings = get_settings()
         self.base_url = settings.ollama_base_url.rstrip("/")
         self.model = settings.resolved_llm_model()
-        self.max_tokens = settings.max_tokens
         self.cost_per_1k_tokens = float(
             getattr(settings, "cost_per_1k_tokens", "0.0")
         )
-        self._client = httpx.Client(base_url=self.base_url, timeout=30)
+        # Long-lived clients so requests reuse keep-alive connections from one pool.
+        self._client = httpx.Client(
+            base_url=self.base_url, timeout=30, limits=_HTTP_POOL_LIMITS
+        )
+        self._async_client = httpx.AsyncClient(
+            base_url=self.base_url, timeout=30, limits=_HTTP_POOL_LIMITS
+        )
 
-    def generate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:
-        target_tokens = min(max_tokens, self.max_tokens)
-        payload = {
+    async def aclose(self) -> None:
+        self._client.close()
+        await self._async_client.aclose()
+
+    def _request(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        return {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": target_tokens,
+            "max_tokens": max_tokens,
             "stream": False,
             "format": "json",
         }
-        resp = self._client.post("/v1/chat/completions", json=payload)
+
+    def generate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:
+        resp = self._client.post("/v1/chat/completions", json=self._request(prompt, max_tokens))
+        resp.raise_for_status()
+        return self._to_response(resp.json())
+
+    async def agenerate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:
+        resp = await self._async_client.post(
+            "/v1/chat/completions", json=self._request(prompt, max_tokens)
+        )
         resp.raise_for_status()
-        data = resp.json()
+        return self._to_response(resp.json())
+
+    def _to_response(self, data: Dict[str, Any]) -> LLMResponse:
         content = data["choices"][0]["message"]["content"] if data.get("choices") else "{}"
         prompt_tokens = data.get("prompt_eval_count", 0)
         completion_tokens = data.get("eval_count", 0)
         cost_usd = ((prompt_tokens + completion_tokens) / 1000) * self.cost_per_1k_tokens
 
-        logger.info(
-            "llm_generate",
-            extra=log_extra(
-                provider="ollama",
-                model=self.model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                cost_usd=round(cost_usd, 6),
-            ),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "llm_generate",
+                extra=log_extra(
+                    provider="ollama",
+                    model=self.model,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    cost_usd=round(cost_usd, 6),
+                ),
+            )
         return LLMResponse(
             content=content,
             prompt_tokens=prompt_tokens,
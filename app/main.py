@@ -1,5 +1,7 @@
-import json
+import asyncio
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -8,6 +10,7 @@ from fastapi.responses import JSONResponse
 
 from .agent import IncidentTriageAgent
 from .config import get_settings
+from .io_utils import read_json
 from .logging_utils import configure_logging, log_extra, set_request_id
 from .models import FileTriageRequest, IncidentResponse, IncidentTicket
 from .llm import build_llm_client
@@ -25,9 +28,19 @@ logging_tracer = LoggingTracer(logging.getLogger("app.tracer"))
 file_tracer = FileTracer(settings.traces_path)
 tracer = MultiTracer([logging_tracer, file_tracer])
 agent = IncidentTriageAgent(kb_tool, history_tool, llm_client=llm_client, tracer=tracer)
+batch_executor = ThreadPoolExecutor(
+    max_workers=settings.batch_max_workers, thread_name_prefix="triage-batch"
+)
 app = FastAPI(title="Enterprise Incident Triage AI Agent", version="0.1.0")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    batch_executor.shutdown(wait=False)
+    file_tracer.flush()
+    await llm_client.aclose()
+
+
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
     rid = request.headers.get("X-Request-ID") or set_request_id()
@@ -43,32 +56,43 @@ def health():
 
 
 @app.post("/triage", response_model=IncidentResponse)
-def triage(ticket: IncidentTicket):
-    recommendation = agent.process(ticket)
+async def triage(ticket: IncidentTicket):
+    recommendation = await agent.aprocess(ticket)
     return IncidentResponse(ticket=ticket, recommendation=recommendation)
 
 
 @app.post("/triage/batch", response_model=List[IncidentResponse])
-def triage_batch(tickets: List[IncidentTicket]):
-    responses: List[IncidentResponse] = []
-    for ticket in tickets:
-        recommendation = agent.process(ticket)
-        responses.append(IncidentResponse(ticket=ticket, recommendation=recommendation))
-    return responses
+async def triage_batch(tickets: List[IncidentTicket]):
+    loop = asyncio.get_running_loop()
+    # One LLM request per fixed-size sub-batch, so each request's output budget stays bounded.
+    # Sub-batches run concurrently off the event loop, each in a copy of the request context
+    # so request_id still reaches log records.
+    sub_batches = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                batch_executor, contextvars.copy_context().run, agent.process_sub_batch, sub_batch
+            )
+            for sub_batch in agent.sub_batches(tickets)
+        )
+    )
+    recommendations = [rec for sub_batch in sub_batches for rec in sub_batch]
+    return [
+        IncidentResponse(ticket=ticket, recommendation=recommendation)
+        for ticket, recommendation in zip(tickets, recommendations)
+    ]
 
 
 @app.post("/triage/file", response_model=IncidentResponse)
-def triage_file(request: FileTriageRequest):
+async def triage_file(request: FileTriageRequest):
     file_path = Path(request.path)
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="file not found")
-    with open(file_path, "r") as f:
-        payload = json.load(f)
+    payload = await asyncio.to_thread(read_json, file_path)
     try:
         ticket = IncidentTicket(**payload)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"invalid ticket: {exc}") from exc
-    recommendation = agent.process(ticket)
+    recommendation = await agent.aprocess(ticket)
     return IncidentResponse(ticket=ticket, recommendation=recommendation)
 
 
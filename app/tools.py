@@ -1,34 +1,88 @@
-import json
 import logging
 import os
-from typing import List
+from typing import Dict, List, Sequence, Tuple
+
+import ahocorasick
 
 from .config import get_settings
+from .io_utils import read_json
 
 logger = logging.getLogger(__name__)
 
 
+class _KeywordIndex:
+    """
+    Aho-Corasick automaton over one text field of the loaded entries.
+    A search is a single pass over the text regardless of how many entries exist.
+    """
+
+    def __init__(self, entries: Sequence[dict], field: str, default_id: str):
+        self._automaton = ahocorasick.Automaton()
+        # An empty keyword is a substring of every text, so those entries always match.
+        self._always: List[str] = []
+        for entry in entries:
+            keyword = entry.get(field, "").lower()
+            entry_id = entry.get("id", default_id)
+            if not keyword:
+                self._always.append(entry_id)
+                continue
+            ids = self._automaton.get(keyword, None)
+            if ids is None:
+                self._automaton.add_word(keyword, [entry_id])
+            else:
+                ids.append(entry_id)
+        self._searchable = len(self._automaton) > 0
+        if self._searchable:
+            self._automaton.make_automaton()
+
+    def search(self, text: str) -> List[str]:
+        """Return ids of matching entries in order of first mention in the text."""
+        matches = self._always[:3]
+        if self._searchable and len(matches) < 3:
+            for _, ids in self._automaton.iter(text.lower()):
+                for entry_id in ids:
+                    if entry_id not in matches:
+                        matches.append(entry_id)
+                        if len(matches) == 3:
+                            # Results are capped at three, so the rest of the text is not scanned.
+                            return matches
+        return matches
+
+
+# Parsed entries and their index per (path, field), reused while the file's identity is unchanged.
+# Entries are shared by every tool instance, so they are stored as a tuple.
+_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int, int], Tuple[dict, ...], _KeywordIndex]] = {}
+
+
+def _load_indexed(
+    path: str, field: str, default_id: str, missing_event: str
+) -> Tuple[Tuple[dict, ...], _KeywordIndex]:
+    if not os.path.exists(path):
+        logger.warning(missing_event, extra={"path": path})
+        return (), _KeywordIndex([], field, default_id)
+    st = os.stat(path)
+    # mtime alone is too coarse: a rewrite within the same timestamp tick would be missed.
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _CACHE.get((path, field))
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+    entries = tuple(read_json(path))
+    index = _KeywordIndex(entries, field, default_id)
+    _CACHE[(path, field)] = (signature, entries, index)
+    return entries, index
+
+
 class KnowledgeBaseTool:
     """Simple keyword matcher for knowledge base entries loaded from JSON."""
     def __init__(self, path: str | None = None):
         settings = get_settings()
         self.path = path or settings.knowledge_base_path
-        self.entries = self._load()
-
-    def _load(self) -> List[dict]:
-        if not os.path.exists(self.path):
-            logger.warning("knowledge_base_missing", extra={"path": self.path})
-            return []
-        with open(self.path, "r") as f:
-            return json.load(f)
+        self.entries, self._index = _load_indexed(
+            self.path, "keyword", "kb-entry", "knowledge_base_missing"
+        )
 
     def search(self, text: str) -> List[str]:
-        matches = []
-        lowered = text.lower()
-        for entry in self.entries:
-            if entry.get("keyword", "").lower() in lowered:
-                matches.append(entry.get("id", "kb-entry"))
-        return matches[:3]
+        return self._index.search(text)
 
 
 class HistoryTool:
@@ -36,19 +90,9 @@ class HistoryTool:
     def __init__(self, path: str | None = None):
         settings = get_settings()
         self.path = path or settings.history_path
-        self.records = self._load()
-
-    def _load(self) -> List[dict]:
-        if not os.path.exists(self.path):
-            logger.warning("history_missing", extra={"path": self.path})
-            return []
-        with open(self.path, "r") as f:
-            return json.load(f)
+        self.records, self._index = _load_indexed(
+            self.path, "signal", "history-entry", "history_missing"
+        )
 
     def search(self, text: str) -> List[str]:
-        matches = []
-        lowered = text.lower()
-        for record in self.records:
-            if record.get("signal", "").lower() in lowered:
-                matches.append(record.get("id", "history-entry"))
-        return matches[:3]
+        return self._index.search(text)
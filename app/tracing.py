@@ -1,9 +1,12 @@
-import json
+import atexit
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Protocol
+from typing import Any, Dict, List, Protocol, Tuple
+
+import orjson
 
 from .logging_utils import get_request_id, log_extra
 
@@ -25,20 +28,40 @@ class TraceEvent:
 
 
 class NullTracer:
-    """No-op tracer used by default to avoid overhead."""
+    """No-op tracer used by default; the agent skips building trace payloads for it."""
+
+    __slots__ = ()
+    is_noop = True
 
     def record(self, phase: str, **data: Any) -> None:
         return None
 
 
 class InMemoryTracer:
-    """Collects trace events in memory; useful for tests and debugging."""
+    """
+    Collects trace events in memory; useful for tests and debugging.
+    Phases and payloads are kept in parallel lists. `events` is a read-only snapshot built
+    on each access (O(n)); use `clear()` to reset the tracer.
+    """
+
+    __slots__ = ("phases", "datas")
 
     def __init__(self):
-        self.events: List[TraceEvent] = []
+        self.phases: List[str] = []
+        self.datas: List[Dict[str, Any]] = []
 
     def record(self, phase: str, **data: Any) -> None:
-        self.events.append(TraceEvent(phase=phase, data=data))
+        self.phases.append(phase)
+        self.datas.append(data)
+
+    def clear(self) -> None:
+        self.phases.clear()
+        self.datas.clear()
+
+    @property
+    def events(self) -> Tuple[TraceEvent, ...]:
+        # A tuple, so callers that try to append to or clear the snapshot fail loudly.
+        return tuple(TraceEvent(phase=phase, data=data) for phase, data in zip(self.phases, self.datas))
 
 
 class LoggingTracer:
@@ -55,11 +78,26 @@ class FileTracer:
     """
     Appends trace events to a JSONL file for offline analysis and dataset generation.
     Each line: {"phase": "...", "data": {...}, "request_id": "...", "ts": "..."}
+    Lines are buffered and written in batches: once `flush_every` events are pending,
+    every `flush_interval` seconds from a background thread, and at interpreter exit.
     """
 
-    def __init__(self, path: str | Path):
+    def __init__(self, path: str | Path, flush_every: int = 64, flush_interval: float = 0.05):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self._fh = self.path.open("ab", buffering=1 << 16)
+        self._buf: List[bytes] = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="file-tracer-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+        atexit.register(self.close)
 
     def record(self, phase: str, **data: Any) -> None:
         event = {
@@ -69,20 +107,66 @@ class FileTracer:
             "ts": datetime.now(timezone.utc).isoformat(),
         }
         try:
-            with self.path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(event, default=str) + "\n")
+            line = orjson.dumps(
+                event, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
         except Exception as exc:  # pragma: no cover - defensive
             logging.getLogger("app.tracer").warning("file_trace_failed %s", exc, extra=log_extra(path=str(self.path)))
+            return
+        with self._lock:
+            self._buf.append(line)
+            if len(self._buf) >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._lock:
+            self._flush_locked()
+            self._fh.close()
+
+    def _flush_locked(self) -> None:
+        if not self._buf:
+            return
+        try:
+            if not self._fh.closed:
+                self._fh.write(b"".join(self._buf))
+                self._fh.flush()
+        except Exception as exc:  # pragma: no cover - defensive
+            logging.getLogger("app.tracer").warning("file_trace_failed %s", exc, extra=log_extra(path=str(self.path)))
+        finally:
+            self._buf.clear()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            self.flush()
 
 
 class MultiTracer:
-    """Fan-out tracer to multiple sinks."""
+    """Fan-out tracer to multiple sinks, called in the order given."""
 
     def __init__(self, tracers: List[AgentTracer]):
-        self.tracers = tracers
+        self._tracers = tuple(tracers)
+        # Precomputed once: in-memory sinks cannot fail and skip the try/except; no-op sinks are dropped.
+        self._sinks = [
+            (tracer, type(tracer) is not InMemoryTracer)
+            for tracer in self._tracers
+            if type(tracer) is not NullTracer
+        ]
+
+    @property
+    def tracers(self) -> Tuple[AgentTracer, ...]:
+        """Sinks are fixed at construction; build a new MultiTracer to change them."""
+        return self._tracers
 
     def record(self, phase: str, **data: Any) -> None:
-        for tracer in self.tracers:
+        for tracer, guarded in self._sinks:
+            if not guarded:
+                tracer.record(phase, **data)
+                continue
             try:
                 tracer.record(phase, **data)
             except Exception:
@@ -10,29 +10,29 @@ This builds eval-ready JSON (same shape as data/eval_cases.json) using:
 - severity captured at phase recommendation_finalized (as a starting label to review)
 """
 import argparse
-import json
 from pathlib import Path
 from typing import Dict, List
 
+import orjson
+
 
 def load_traces(path: Path) -> List[dict]:
     events = []
     if not path.exists():
         raise FileNotFoundError(f"Trace file not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
+    with path.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
-                continue
+            # orjson ignores the trailing newline; blank or corrupt lines fail to parse and are skipped.
             try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError:
+                events.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
                 continue
     return events
 
 
 def build_candidates(events: List[dict]) -> List[dict]:
     tickets: Dict[str, dict] = {}
+    last_ticket_id: str | None = None
     cases: List[dict] = []
 
     for event in events:
@@ -42,15 +42,16 @@ def build_candidates(events: List[dict]) -> List[dict]:
             ticket = data.get("ticket")
             if ticket and "id" in ticket:
                 tickets[ticket["id"]] = ticket
+                last_ticket_id = ticket["id"]
         elif phase == "recommendation_finalized":
             severity = data.get("severity")
             ticket_id = None
             # Prefer explicit ticket_id in data; otherwise derive from prior ticket capture
             if "ticket_id" in data:
                 ticket_id = data["ticket_id"]
-            elif tickets:
-                # Fallback: best-effort—this assumes single active ticket per run
-                ticket_id = next(iter(tickets))
+            else:
+                # Fallback: best-effort—attribute to the most recently received ticket
+                ticket_id = last_ticket_id
             if not severity or not ticket_id or ticket_id not in tickets:
                 continue
             cases.append(
@@ -71,8 +72,7 @@ def main():
     events = load_traces(args.traces)
     cases = build_candidates(events)
     args.out.parent.mkdir(parents=True, exist_ok=True)
-    with args.out.open("w", encoding="utf-8") as f:
-        json.dump(cases, f, indent=2)
+    args.out.write_bytes(orjson.dumps(cases, option=orjson.OPT_INDENT_2))
     print(f"Wrote {len(cases)} candidate cases to {args.out}")
     print("Review and update expected_severity as ground truth before adding to data/eval_cases.json")
 
@@ -14,22 +14,21 @@ Defaults:
   mode = skip (skip duplicates by ticket id)
 """
 import argparse
-import json
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
+import orjson
+
 
 def load_cases(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
 def write_cases(path: Path, cases: List[Dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(cases, f, indent=2)
+    path.write_bytes(orjson.dumps(cases, option=orjson.OPT_INDENT_2))
 
 
 def merge_cases(
@@ -42,8 +41,14 @@ def merge_cases(
       - replace: overwrite existing case with same ticket id
     Returns (merged_cases, added_count, replaced_count)
     """
-    merged = list(base)
-    index = {case["ticket"]["id"]: i for i, case in enumerate(base) if "ticket" in case}
+    # Copy base and index it by ticket id in the same pass; cases without an id are kept as-is.
+    merged: List[Dict[str, Any]] = []
+    index: Dict[str, int] = {}
+    for case in base:
+        ticket_id = case.get("ticket", {}).get("id")
+        if ticket_id is not None:
+            index[ticket_id] = len(merged)
+        merged.append(case)
 
     added = 0
     replaced = 0
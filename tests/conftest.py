@@ -4,3 +4,16 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+import pytest  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    # Settings are read from the environment on first use and cached; tests that patch
+    # env vars must not leak their values into later tests.
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
@@ -1,6 +1,8 @@
+import asyncio
 import json
+import threading
 
-from app.agent import IncidentTriageAgent
+from app.agent import IncidentTriageAgent, _scan_and_redact, _triage_text_cached
 from app.llm import LLMResponse, MockLLMClient
 from app.models import IncidentTicket, Severity
 from app.tools import HistoryTool, KnowledgeBaseTool
@@ -66,6 +68,34 @@ def test_tracing_records_core_phases():
     assert contextual and "plan" in contextual[0].data
 
 
+def test_severity_keywords_match_whole_words():
+    agent = build_agent()
+    downtime = IncidentTicket(
+        id="t-10",
+        title="Planned downtime notice",
+        description="Scheduled maintenance window this weekend.",
+    )
+    outages = IncidentTicket(
+        id="t-11",
+        title="Repeated outages",
+        description="Checkout saw two outages overnight.",
+    )
+    assert agent.process(downtime).severity == Severity.P4
+    assert agent.process(outages).severity == Severity.P0
+
+
+def test_p0_tag_follows_updated_tags():
+    agent = build_agent()
+    ticket = IncidentTicket(id="t-tag", title="Dashboard question", description="How do I export?", tags=["P0"])
+    assert agent.process(ticket).severity == Severity.P0
+
+    copied = ticket.model_copy(update={"tags": ["Api"]})
+    assert agent.process(copied).severity != Severity.P0
+
+    ticket.tags = ["api"]
+    assert agent.process(ticket).severity != Severity.P0
+
+
 def test_llm_payload_validation_fallbacks():
     class BadLLM(MockLLMClient):
         def generate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:  # type: ignore[override]
@@ -139,3 +169,123 @@ def test_ip_and_ssn_redaction():
     rec = agent.process(ticket)
     assert rec.redacted is True
     assert "[REDACTED_IP]" in rec.summary or "[REDACTED_SSN]" in rec.summary
+
+
+def test_pii_redaction_with_full_width_digits():
+    agent = build_agent()
+    ticket = IncidentTicket(
+        id="t-7b",
+        title="Callback requested",
+        description="電話 ５５５-１２３-４５６７ まで連絡ください",
+        tags=["request"],
+    )
+    rec = agent.process(ticket)
+    assert rec.redacted is True
+    assert "[REDACTED_PHONE]" in rec.summary
+    assert "５５５" not in rec.summary
+
+
+def test_ascii_and_unicode_paths_redact_alike():
+    samples = [
+        ("mail jane.doe@example.com or call (555) 123-4567", True),
+        ("host 10.0.0.12 ssn 123-45-6789 phone +1 555.123.4567", True),
+        ("nothing sensitive here, build 1234 failed", False),
+        # \v and \x1c are whitespace to a str pattern but not to a default bytes/RE2 \s.
+        ("call 555\x0b123\x0b4567 or 555\x1c123\x1c4567", True),
+    ]
+    for text, expected_pii in samples:
+        ascii_result = _scan_and_redact(text, True)
+        assert ascii_result[0] is expected_pii
+        # A trailing non-ASCII character routes the same text through the str pattern.
+        has_pii, redacted = _scan_and_redact(text + " é", True)
+        assert (has_pii, redacted[: -len(" é")]) == ascii_result
+    assert _scan_and_redact(samples[3][0], True)[1] == "call [REDACTED_PHONE] or [REDACTED_PHONE]"
+
+
+def test_process_batch_uses_single_llm_call():
+    class CountingLLM(MockLLMClient):
+        calls = 0
+
+        def generate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:  # type: ignore[override]
+            CountingLLM.calls += 1
+            return super().generate(prompt, max_tokens=max_tokens)
+
+    agent = IncidentTriageAgent(
+        kb_tool=KnowledgeBaseTool(),
+        history_tool=HistoryTool(),
+        llm_client=CountingLLM(),
+    )
+    tickets = [
+        IncidentTicket(id="b-1", title="Global outage", description="API is down", tags=["api"]),
+        IncidentTicket(id="b-2", title="Laptop request", description="User asks for a laptop", tags=[]),
+    ]
+    recs = agent.process_batch(tickets)
+    assert CountingLLM.calls == 1
+    assert [r.severity for r in recs] == [Severity.P0, Severity.P3]
+    assert recs[1].summary.startswith("User asks")
+
+
+def test_process_batch_splits_into_bounded_sub_batches(monkeypatch):
+    budgets = []
+
+    class RecordingLLM(MockLLMClient):
+        def generate(self, prompt: str, max_tokens: int = 512) -> LLMResponse:  # type: ignore[override]
+            budgets.append(max_tokens)
+            return super().generate(prompt, max_tokens=max_tokens)
+
+    monkeypatch.setenv("BATCH_SIZE", "2")
+    monkeypatch.setenv("BATCH_MAX_TOKENS", "800")
+    agent = IncidentTriageAgent(
+        kb_tool=KnowledgeBaseTool(),
+        history_tool=HistoryTool(),
+        llm_client=RecordingLLM(),
+    )
+    tickets = [
+        IncidentTicket(id=f"s-{i}", title="Global outage", description="API is down", tags=[])
+        for i in range(5)
+    ]
+    recs = agent.process_batch(tickets)
+    assert budgets == [800, 800, 512]
+    assert [r.severity for r in recs] == [Severity.P0] * 5
+
+
+def test_aprocess_matches_process():
+    agent = build_agent()
+    ticket = IncidentTicket(
+        id="t-9",
+        title="Database latency alert",
+        description="Primary database showing elevated latency after deploy",
+        tags=["db", "latency"],
+    )
+    rec = asyncio.run(agent.aprocess(ticket))
+    assert rec == agent.process(ticket)
+
+
+def test_aprocess_prepares_off_the_event_loop():
+    prepare_threads = []
+
+    class ThreadRecordingAgent(IncidentTriageAgent):
+        def _prepare(self, ticket):
+            prepare_threads.append(threading.current_thread())
+            return super()._prepare(ticket)
+
+    agent = ThreadRecordingAgent(
+        kb_tool=KnowledgeBaseTool(),
+        history_tool=HistoryTool(),
+        llm_client=MockLLMClient(),
+    )
+    ticket = IncidentTicket(id="t-10", title="Login errors", description="Users see an error on login")
+    asyncio.run(agent.aprocess(ticket))
+    assert prepare_threads and prepare_threads[0] is not threading.main_thread()
+
+
+def test_large_descriptions_are_not_memoized():
+    agent = build_agent()
+    _triage_text_cached.cache_clear()
+    large = IncidentTicket(id="t-11", title="Log dump", description="error 555-123-4567 " * 1000)
+    rec = agent.process(large)
+    assert rec.redacted is True
+    assert _triage_text_cached.cache_info().currsize == 0
+
+    agent.process(IncidentTicket(id="t-12", title="Short", description="API error"))
+    assert _triage_text_cached.cache_info().currsize == 1
@@ -0,0 +1,38 @@
+import json
+
+import scripts.evaluate as evaluate_script
+from app.agent import IncidentTriageAgent
+from app.llm import MockLLMClient
+from app.tools import HistoryTool, KnowledgeBaseTool
+
+
+class CountingAgent(IncidentTriageAgent):
+    def __init__(self):
+        super().__init__(KnowledgeBaseTool(), HistoryTool(), llm_client=MockLLMClient())
+        self.calls = 0
+
+    def process(self, ticket):
+        self.calls += 1
+        return super().process(ticket)
+
+
+def test_evaluate_triages_identical_cases_once(tmp_path, monkeypatch):
+    case = {
+        "ticket": {"id": "dup-1", "title": "API outage", "description": "Service is down", "tags": ["api"]},
+        "expected_severity": "P0",
+    }
+    path = tmp_path / "cases.json"
+    path.write_text(json.dumps([case, case]))
+    agent = CountingAgent()
+    monkeypatch.setattr(evaluate_script, "_agent", agent)
+
+    results = evaluate_script.evaluate(path, max_workers=1)
+
+    assert agent.calls == 1
+    assert [r.passed for r in results] == [True, True]
+
+
+def test_evaluate_handles_empty_case_file(tmp_path):
+    path = tmp_path / "cases.json"
+    path.write_text("[]")
+    assert evaluate_script.evaluate(path) == []
@@ -1,3 +1,5 @@
+import json
+
 from app.tools import HistoryTool, KnowledgeBaseTool
 
 
@@ -24,3 +26,33 @@ def test_tools_handle_missing_files(tmp_path, monkeypatch):
     hist = HistoryTool()
     assert kb.search("anything") == []
     assert hist.search("anything") == []
+
+
+def test_knowledge_base_search_returns_entries_sharing_a_keyword(tmp_path):
+    kb_path = tmp_path / "kb.json"
+    kb_path.write_text(
+        json.dumps(
+            [
+                {"id": "kb-a", "keyword": "vpn"},
+                {"id": "kb-b", "keyword": "VPN"},
+                {"id": "kb-c", "keyword": "latency"},
+                {"id": "kb-d", "keyword": "disk"},
+            ]
+        )
+    )
+    kb = KnowledgeBaseTool(path=str(kb_path))
+    assert kb.search("High latency on the vpn gateway") == ["kb-c", "kb-a", "kb-b"]
+    assert kb.search("nothing relevant") == []
+
+
+def test_tools_reuse_parsed_file_until_it_changes(tmp_path):
+    kb_path = tmp_path / "kb.json"
+    kb_path.write_text(json.dumps([{"id": "kb-a", "keyword": "vpn"}]))
+    first = KnowledgeBaseTool(path=str(kb_path))
+    second = KnowledgeBaseTool(path=str(kb_path))
+    assert second.entries is first.entries
+
+    # Rewritten in place, possibly within the same mtime tick; the size change is still seen.
+    kb_path.write_text(json.dumps([{"id": "kb-b", "keyword": "disk"}]))
+    third = KnowledgeBaseTool(path=str(kb_path))
+    assert third.search("disk full") == ["kb-b"]
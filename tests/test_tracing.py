@@ -0,0 +1,60 @@
+import json
+
+from app.tracing import FileTracer, InMemoryTracer, MultiTracer, NullTracer
+
+
+def test_file_tracer_buffers_until_flush(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = FileTracer(path, flush_every=3, flush_interval=60)
+    tracer.record("ticket_received", ticket_id="t-1")
+    tracer.record("severity_scored", severity="P1")
+    assert path.read_text() == ""
+
+    tracer.record("recommendation_finalized", ticket_id="t-1")
+    tracer.record("ticket_received", ticket_id="t-2")
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["phase"] for line in lines] == [
+        "ticket_received",
+        "severity_scored",
+        "recommendation_finalized",
+    ]
+
+    tracer.close()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[-1])["data"] == {"ticket_id": "t-2"}
+
+
+def test_multi_tracer_isolates_failing_sinks():
+    calls = []
+
+    class BrokenTracer:
+        def record(self, phase, **data):
+            calls.append("broken")
+            raise RuntimeError("sink down")
+
+    class SpyTracer(InMemoryTracer):
+        def record(self, phase, **data):
+            calls.append("spy")
+            super().record(phase, **data)
+
+    memory = InMemoryTracer()
+    tracer = MultiTracer([NullTracer(), BrokenTracer(), SpyTracer(), memory])
+    tracer.record("pii_scan", has_pii=False)
+
+    assert calls == ["broken", "spy"]
+    assert memory.phases == ["pii_scan"]
+    assert memory.events[0].data == {"has_pii": False}
+    assert isinstance(tracer.tracers, tuple)
+
+
+def test_in_memory_tracer_events_are_a_read_only_snapshot():
+    tracer = InMemoryTracer()
+    tracer.record("ticket_received", ticket_id="t-1")
+    events = tracer.events
+    assert [e.phase for e in events] == ["ticket_received"]
+    assert not hasattr(events, "append")
+
+    tracer.clear()
+    assert tracer.events == ()
+    assert tracer.phases == []